@@ -0,0 +1,30 @@
+import contextlib
+import os
+import pathlib
+import shutil
+import tempfile
+
+
+@contextlib.contextmanager
+def atomic_write(path, mode="w"):
+	"""Yields a tempfile next to `path` that replaces it when the block exits cleanly.
+
+	The tempfile shares the target's directory so `os.replace` is an atomic rename,
+	and it is removed if anything fails before the replace.
+	"""
+	path = pathlib.Path(path)
+	temp_file = tempfile.NamedTemporaryFile(
+		mode,
+		dir=path.parent,
+		prefix=f".{path.name}.",
+		suffix=".tmp",
+		delete=False,
+	)
+	try:
+		with temp_file:
+			yield temp_file
+		shutil.copymode(path, temp_file.name)
+		os.replace(temp_file.name, path)
+	except BaseException:
+		os.unlink(temp_file.name)
+		raise
@@ -1,16 +1,15 @@
 import argparse
-import copy
 import datetime
 import json
-import os
 import pathlib
 import sys
-import tempfile
 from typing import Sequence
 
-from test_utils.pre_commit.validate_customizations import scrub
+from test_utils.pre_commit.atomic_write import atomic_write
+from test_utils.pre_commit.validate_customizations import iter_json_files, scrub
 
 DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+NULLABLE_KEYS = frozenset(("default", "value"))
 
 
 def get_customized_doctypes_to_clean(app):
@@ -22,47 +21,55 @@ def get_customized_doctypes_to_clean(app):
 
 	modules = (app_dir / app / "modules.txt").read_text().split("\n")
 	for module in modules:
-		if not (app_dir / app / scrub(module) / "custom").exists():
+		if not module:
 			continue
 
-		for custom_file in list((app_dir / app / scrub(module) / "custom").glob("**/*.json")):
-			if custom_file.stem in customized_doctypes:
-				customized_doctypes[custom_file.stem].append(custom_file.resolve())
-			else:
-				customized_doctypes[custom_file.stem] = [custom_file.resolve()]
+		custom_dir = app_dir / app / scrub(module) / "custom"
+		if not custom_dir.is_dir():
+			continue
+
+		# resolve the directory once; files found beneath it are already absolute
+		for custom_file in iter_json_files(custom_dir.resolve()):
+			customized_doctypes.setdefault(custom_file.stem, []).append(custom_file)
 
 	return customized_doctypes
 
 
+def strip_null_values(doc):
+	"""Returns a copy of `doc` without null values, except for keys that may be null."""
+	return {
+		key: value for key, value in doc.items() if value is not None or key in NULLABLE_KEYS
+	}
+
+
+def clean_customize_file(customize_file):
+	with open(customize_file) as f:
+		file_contents = json.load(f)
+
+	cleaned_contents = strip_null_values(file_contents)
+	changed = len(cleaned_contents) != len(file_contents)
+	for key, value in cleaned_contents.items():
+		if isinstance(value, list):
+			cleaned_items = [strip_null_values(item) for item in value]
+			changed = changed or any(
+				len(cleaned_item) != len(item) for cleaned_item, item in zip(cleaned_items, value)
+			)
+			cleaned_contents[key] = cleaned_items
+
+	if changed:
+		with atomic_write(customize_file) as temp_file:
+			json.dump(cleaned_contents, temp_file, indent="\t", sort_keys=True)
+
+	return changed
+
+
 def validate_and_clean_customized_doctypes(customized_doctypes):
-	modified_files = []
-	for doctype, customize_files in customized_doctypes.items():
-		for customize_file in customize_files:
-			temp_file_path = tempfile.mktemp()
-			with open(customize_file) as f, open(temp_file_path, "w") as temp_file:
-				file_contents = json.load(f)
-				original_content = copy.deepcopy(file_contents)
-				for key, value in list(file_contents.items()):
-					if isinstance(value, list):
-						for item in value:
-							for item_key, item_value in list(item.items()):
-								if item_value is None and item_key not in [
-									"default",
-									"value",
-								]:
-									del item[item_key]
-
-					elif value is None and key not in ["default", "value"]:
-						del file_contents[key]
-
-				if file_contents != original_content:
-					temp_file.write(json.dumps(file_contents, indent="\t", sort_keys=True))
-					os.replace(temp_file_path, customize_file)
-					modified_files.append(customize_file)
-				else:
-					os.remove(temp_file_path)
-
-	return modified_files
+	return [
+		customize_file
+		for customize_files in customized_doctypes.values()
+		for customize_file in customize_files
+		if clean_customize_file(customize_file)
+	]
 
 
 def main(argv: Sequence[str] = None):
@@ -1,10 +1,11 @@
 import argparse
 import datetime
-import os
+import shutil
 import sys
-import tempfile
 from typing import Sequence
 
+from test_utils.pre_commit.atomic_write import atomic_write
+
 
 def validate_copyright(app, files):
 	year = datetime.datetime.now().year
@@ -36,18 +37,21 @@ def validate_copyright(app, files):
 
 
 def validate_and_write_file(file, initial_string, copyright_string):
+	initial_bytes = initial_string.encode()
+	with open(file, "rb") as original_file:
+		if original_file.read(len(initial_bytes)) == initial_bytes:
+			return
+
 	# using tempfile to avoid issues while reading large files
-	temp_file_path = tempfile.mktemp()
-	with open(file) as original_file, open(temp_file_path, "w") as temp_file:
+	with open(file, "rb") as original_file, atomic_write(file, "wb") as temp_file:
 		first_line = original_file.readline()
-		if not first_line.startswith(initial_string):
-			temp_file.write(copyright_string)
-			temp_file.write(first_line)
-			temp_file.writelines(original_file)
-			temp_file.writelines(original_file)
-
-			# Replace the original file with the temp file
-			os.replace(temp_file_path, file)
+		# match the header's line endings to the file so CRLF files stay consistent
+		if first_line.endswith(b"\r\n"):
+			copyright_string = copyright_string.replace("\n", "\r\n")
+
+		temp_file.write(copyright_string.encode())
+		temp_file.write(first_line)
+		shutil.copyfileobj(original_file, temp_file)
 
 
 def main(argv: Sequence[str] = None):
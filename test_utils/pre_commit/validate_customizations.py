@@ -1,6 +1,7 @@
 import argparse
 import ast
 import json
+import os
 import pathlib
 import sys
 import types
@@ -17,6 +18,20 @@ def unscrub(txt: str) -> str:
 	return txt.replace("_", " ").replace("-", " ").title()
 
 
+def iter_json_files(directory):
+	"""Yields every `.json` file below `directory`, recursing into subdirectories."""
+	with os.scandir(directory) as entries:
+		for entry in entries:
+			if entry.is_dir(follow_symlinks=False):
+				yield from iter_json_files(entry.path)
+			elif entry.name.endswith(".json") and entry.is_file():
+				# symlinked files are resolved so cleaning rewrites the target, not the link
+				if entry.is_symlink():
+					yield pathlib.Path(entry.path).resolve()
+				else:
+					yield pathlib.Path(entry.path)
+
+
 def get_customized_doctypes():
 	apps_dir = pathlib.Path().resolve().parent
 	apps_order = pathlib.Path().resolve().parent.parent / "sites" / "apps.txt"
@@ -28,15 +43,14 @@ def get_customized_doctypes():
 			continue
 		modules = (app_dir / _app_dir / "modules.txt").read_text().split("\n")
 		for module in modules:
-			if not (app_dir / _app_dir / scrub(module) / "custom").exists():
+			if not module:
 				continue
-			for custom_file in list(
-				(app_dir / _app_dir / scrub(module) / "custom").glob("**/*.json")
-			):
-				if custom_file.stem in customized_doctypes:
-					customized_doctypes[custom_file.stem].append(custom_file.resolve())
-				else:
-					customized_doctypes[custom_file.stem] = [custom_file.resolve()]
+			custom_dir = app_dir / _app_dir / scrub(module) / "custom"
+			if not custom_dir.is_dir():
+				continue
+			# resolve the directory once; files found beneath it are already absolute
+			for custom_file in iter_json_files(custom_dir.resolve()):
+				customized_doctypes.setdefault(custom_file.stem, []).append(custom_file)
 		if app_dir.stem == "hrms":
 			pass
 
@@ -24,31 +24,20 @@ def get_versions(app):
 def get_mismatched_versions():
 	apps_order = pathlib.Path().resolve().parent.parent / "sites" / "apps.txt"
 	apps_order = apps_order.read_text().split("\n")
-	exceptions = []
 	app_packages = {app: get_versions(app) for app in apps_order}
+	package_versions = {}
 	for app, packages in app_packages.items():
 		if not packages:
 			continue
 
 		for package, package_version in packages.items():
-			for app2, app2_packages in app_packages.items():
-				if not app2_packages:
-					continue
-
-				if app == app2:
-					continue
-
-				if package in app2_packages and app2_packages[package] != package_version:
-					# Check if exception already exists
-					existing_exception = next(
-						(exception for exception in exceptions if package in exception),
-						None,
-					)
-					if existing_exception:
-						existing_exception[package][app] = package_version
-					else:
-						exceptions.append({package: {app: package_version}})
+			package_versions.setdefault(package, {})[app] = package_version
 
+	exceptions = [
+		{package: versions}
+		for package, versions in package_versions.items()
+		if len(set(versions.values())) > 1
+	]
 	return exceptions
 
 
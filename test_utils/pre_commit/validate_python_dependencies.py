@@ -1,10 +1,14 @@
 import argparse
 import pathlib
+import re
 import sys
 from typing import Sequence
 
 import toml
 
+DEPENDENCY_PATTERN = re.compile(r"^(.*?)(==|~=|>=|<=)(.*)$")
+VERSION_PREFIXES = {"==": "", "~=": "~", ">=": ">=", "<=": "<="}
+
 
 def get_dependencies(app):
 	apps_dir = pathlib.Path().resolve().parent
@@ -30,17 +34,10 @@ def get_versions(app):
 
 	dependency_objects = {}
 	for dep in dependencies:
-		if "==" in dep:
-			package, version = dep.split("==")
-		elif "~=" in dep:
-			package, version = dep.split("~=")
-			version = "~" + version
-		elif ">=" in dep:
-			package, version = dep.split(">=")
-			version = ">=" + version
-		elif "<=" in dep:
-			package, version = dep.split("<=")
-			version = "<=" + version
+		match = DEPENDENCY_PATTERN.match(dep)
+		if match:
+			package, operator, version = match.groups()
+			version = VERSION_PREFIXES[operator] + version
 		else:
 			package = dep
 			version = ""
@@ -53,23 +50,17 @@ def get_versions(app):
 def get_mismatched_versions():
 	apps_order = pathlib.Path().resolve().parent.parent / "sites" / "apps.txt"
 	apps_order = apps_order.read_text().split("\n")
-	exceptions = []
 	app_packages = {app: get_versions(app) for app in apps_order}
+	package_versions = {}
 	for app, packages in app_packages.items():
 		for package, package_version in packages.items():
-			for app2, app2_packages in app_packages.items():
-				if app == app2:
-					continue
-
-				if package in app2_packages and app2_packages[package] != package_version:
-					# Check if exception already exists
-					existing_exception = next(
-						(exception for exception in exceptions if package in exception), None
-					)
-					if existing_exception:
-						existing_exception[package][app] = package_version
-					else:
-						exceptions.append({package: {app: package_version}})
+			package_versions.setdefault(package, {})[app] = package_version
+
+	exceptions = [
+		{package: versions}
+		for package, versions in package_versions.items()
+		if len(set(versions.values())) > 1
+	]
 	return exceptions
 
 